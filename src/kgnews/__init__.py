@@ -1,8 +1,15 @@
 """Kagi News Reader - A terminal-based news reader for Kagi News."""
 
-from kgnews.app import KagiNewsApp
-
 __version__ = "0.1.0"
 __author__ = "Kagi News Reader Team"
 
 __all__ = ["KagiNewsApp"]
+
+
+def __getattr__(name: str):
+    """Import KagiNewsApp lazily so importing kgnews doesn't load Textual."""
+    if name == "KagiNewsApp":
+        from kgnews.app import KagiNewsApp
+
+        return KagiNewsApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
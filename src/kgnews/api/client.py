@@ -1,14 +1,37 @@
 """API client for Kagi News."""
 
+import asyncio
+import importlib.util
 import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
 from datetime import datetime
+from typing import Any, TypeVar
 
 import httpx
 
 from kgnews.models import Category, Story
+from kgnews.utils import json
+
+try:
+    import simdjson
+except ImportError:  # pysimdjson is an optional speedup
+    simdjson = None
+
+try:
+    from kgnews.api import schema
+except ImportError:  # msgspec is an optional speedup
+    schema = None
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# HTTP/2 needs the optional h2 package (installed via the httpx[http2] extra)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# JSON array types a decoded response may contain (simdjson arrays are lazy proxies)
+JSON_ARRAY_TYPES: tuple[type, ...] = (list, simdjson.Array) if simdjson else (list,)
+
 
 class APIError(Exception):
     """Base exception for API errors."""
@@ -36,6 +59,7 @@ class APIClient:
 
     BASE_URL = "https://news.kagi.com"
     TIMEOUT = 10.0  # 10 seconds
+    MAX_CONCURRENT_FETCHES = 8  # Story requests in flight at once
 
     def __init__(self, base_url: str | None = None, timeout: float | None = None):
         """Initialize API client.
@@ -47,36 +71,162 @@ class APIClient:
         self.base_url = base_url or self.BASE_URL
         self.timeout = timeout or self.TIMEOUT
 
-    async def get_latest_batch(self) -> dict:
-        """Fetch latest batch information.
+        # Shared client so keep-alive connections are reused across requests.
+        # With HTTP/2, concurrent story fetches multiplex over one connection.
+        # httpx advertises br/zstd in Accept-Encoding whenever their decoders
+        # are installed (see the speedups extra) and decodes transparently,
+        # so response.content is always plain JSON bytes.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+
+        # Reusable simdjson parser avoids per-response allocation
+        self._parser = simdjson.Parser() if simdjson else None
+
+        # Bounds story fetches across all callers so bursts (refreshes,
+        # prefetches) never open more connections than the pool keeps alive
+        self._fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+
+        # In-flight requests keyed by endpoint and arguments, for coalescing
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+        # Conditional request headers and last parsed result per endpoint, so
+        # unchanged resources come back as an empty 304 and skip parsing
+        self._validated: dict[str, tuple[dict[str, str], Any]] = {}
+
+    async def __aenter__(self) -> "APIClient":
+        """Enter async context, returning the client itself."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Exit async context, closing the underlying HTTP client."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
+    def _decode(self, content: bytes, lazy: bool = False) -> Any:
+        """Parse a JSON response body.
+
+        Args:
+            content: Raw response body
+            lazy: Return a lazy simdjson document instead of Python objects.
+                The document is only valid until the next call, so it must be
+                fully consumed before awaiting anything else.
 
         Returns:
-            Dictionary containing batch metadata including:
-            - id: Batch UUID
-            - createdAt: Creation timestamp
-            - totalCategories: Number of categories
-            - totalClusters: Number of story clusters
-            - totalArticles: Number of articles
+            Decoded JSON document
+        """
+        if self._parser is not None:
+            try:
+                return self._parser.parse(content, recursive=not lazy)
+            except RuntimeError:
+                # Proxies from an earlier lazy parse are still alive and lock
+                # the shared parser; fall back to a fresh one
+                return simdjson.Parser().parse(content, recursive=not lazy)
+        return json.loads(content)
+
+    def _conditional_headers(self, endpoint: str) -> dict[str, str]:
+        """Get If-None-Match/If-Modified-Since headers for an endpoint.
+
+        Args:
+            endpoint: Request URL
+
+        Returns:
+            Conditional request headers (empty if nothing is cached yet)
+        """
+        validated = self._validated.get(endpoint)
+        return validated[0] if validated else {}
+
+    def _remember_validators(
+        self, endpoint: str, response: httpx.Response, result: Any
+    ) -> None:
+        """Store a response's ETag/Last-Modified along with its parsed result.
+
+        Args:
+            endpoint: Request URL
+            response: Successful response
+            result: Parsed result to return on a later 304 Not Modified
+        """
+        headers = {}
+        if etag := response.headers.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := response.headers.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+
+        if headers:
+            self._validated[endpoint] = (headers, result)
+        else:
+            self._validated.pop(endpoint, None)
+
+    async def _coalesce(
+        self,
+        key: Hashable,
+        fetch: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run a fetch, sharing its result with concurrent identical calls.
+
+        The first caller for a key starts the fetch; callers arriving while it
+        is still in flight await the same task instead of issuing a duplicate
+        request.
+
+        Args:
+            key: Identifies the request (endpoint and arguments)
+            fetch: Coroutine function performing the request
+            *args: Positional arguments passed to fetch
+            **kwargs: Keyword arguments passed to fetch
+
+        Returns:
+            Result of the fetch
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch(*args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one caller being cancelled doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+
+    async def _get_json(
+        self,
+        endpoint: str,
+        parse: Callable[[bytes], T],
+        params: dict[str, Any] | None = None,
+        conditional: bool = False,
+    ) -> T:
+        """Perform a GET request and parse the response body.
+
+        Args:
+            endpoint: Request URL
+            parse: Converts the raw response body into the result
+            params: Optional query parameters
+            conditional: Send ETag/Last-Modified validators and reuse the
+                previous result when the server answers 304 Not Modified
+
+        Returns:
+            Parsed result
 
         Raises:
             APITimeoutError: If request times out
             APIResponseError: If response is malformed or invalid
             APIError: For other API errors
         """
-        endpoint = f"{self.base_url}/api/batches/latest"
+        headers = self._conditional_headers(endpoint) if conditional else None
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(endpoint)
-                response.raise_for_status()
-                data = response.json()
+            response = await self._client.get(endpoint, params=params, headers=headers)
+            if conditional and response.status_code == httpx.codes.NOT_MODIFIED:
+                logger.debug(f"{endpoint} not modified, reusing previous result")
+                return self._validated[endpoint][1]
 
-            # Validate response has required fields
-            if "id" not in data:
-                raise APIResponseError("Invalid response format: missing batch id")
-
-            logger.info(f"Fetched latest batch: {data.get('id')}")
-            return data
+            response.raise_for_status()
 
         except httpx.TimeoutException as e:
             logger.error(f"Request timed out: {e}")
@@ -92,73 +242,125 @@ class APIClient:
             logger.error(f"Request error: {e}")
             raise APIError(f"Failed to connect to {endpoint}: {e}") from e
 
-        except (ValueError, KeyError) as e:
+        try:
+            result = parse(response.content)
+        except APIError:
+            raise
+        except Exception as e:
+            # Any parse failure means the body isn't what we expect
             logger.error(f"Failed to parse response: {e}")
             raise APIResponseError(f"Malformed API response: {e}") from e
 
-    async def get_categories(self) -> list[Category]:
-        """Fetch available news categories from the latest batch.
+        if conditional:
+            self._remember_validators(endpoint, response, result)
+        return result
+
+    async def get_latest_batch(self) -> dict:
+        """Fetch latest batch information.
 
         Returns:
-            List of Category objects
+            Dictionary containing batch metadata including:
+            - id: Batch UUID
+            - createdAt: Creation timestamp
+            - totalCategories: Number of categories
+            - totalClusters: Number of story clusters
+            - totalArticles: Number of articles
 
         Raises:
             APITimeoutError: If request times out
             APIResponseError: If response is malformed or invalid
             APIError: For other API errors
         """
-        endpoint = f"{self.base_url}/api/batches/latest/categories"
+        endpoint = f"{self.base_url}/api/batches/latest"
+        return await self._coalesce(
+            endpoint,
+            self._get_json,
+            endpoint,
+            self._parse_latest_batch,
+            conditional=True,
+        )
 
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(endpoint)
-                response.raise_for_status()
-                data = response.json()
+    def _parse_latest_batch(self, content: bytes) -> dict:
+        """Parse a latest batch response.
 
-            # Extract categories array from response
-            categories_data = data.get("categories", [])
+        Args:
+            content: Raw response body
 
-            if not isinstance(categories_data, list):
-                raise APIResponseError(
-                    "Invalid response format: categories is not a list"
-                )
+        Returns:
+            Batch metadata dictionary
 
-            # Parse each category
-            categories = []
-            for cat_data in categories_data:
-                try:
-                    # Map API fields to our Category model
-                    category_dict = {
-                        "id": cat_data.get("id"),
-                        "name": cat_data.get("categoryId"),
-                        "display_name": cat_data.get("categoryName"),
-                    }
-                    category = Category.from_api_response(category_dict)
-                    categories.append(category)
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Failed to parse category: {e}")
-                    continue
+        Raises:
+            APIResponseError: If the batch id is missing
+            ValueError: If the body is not valid JSON
+        """
+        data = self._decode(content)
 
-            logger.info(f"Fetched {len(categories)} categories")
-            return categories
+        # Validate response has required fields
+        if "id" not in data:
+            raise APIResponseError("Invalid response format: missing batch id")
 
-        except httpx.TimeoutException as e:
-            logger.error(f"Request timed out: {e}")
-            raise APITimeoutError(
-                f"Request to {endpoint} timed out after {self.timeout}s"
-            ) from e
+        logger.info(f"Fetched latest batch: {data.get('id')}")
+        return data
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e}")
-            raise APIError(f"HTTP {e.response.status_code}: {e}") from e
+    async def get_categories(self) -> list[Category]:
+        """Fetch available news categories from the latest batch.
 
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
-            raise APIError(f"Failed to connect to {endpoint}: {e}") from e
+        Returns:
+            List of Category objects
 
-        except (ValueError, KeyError) as e:
-            logger.error(f"Failed to parse response: {e}")
-            raise APIResponseError(f"Malformed API response: {e}") from e
+        Raises:
+            APITimeoutError: If request times out
+            APIResponseError: If response is malformed or invalid
+            APIError: For other API errors
+        """
+        endpoint = f"{self.base_url}/api/batches/latest/categories"
+        return await self._coalesce(
+            endpoint,
+            self._get_json,
+            endpoint,
+            self._parse_categories,
+            conditional=True,
+        )
+
+    def _parse_categories(self, content: bytes) -> list[Category]:
+        """Parse a categories response into Category objects.
+
+        Args:
+            content: Raw response body
+
+        Returns:
+            List of Category objects
+
+        Raises:
+            APIResponseError: If the categories field is not a list
+            ValueError: If the body is not valid JSON
+        """
+        data = self._decode(content)
+
+        # Extract categories array from response
+        categories_data = data.get("categories", [])
+
+        if not isinstance(categories_data, list):
+            raise APIResponseError("Invalid response format: categories is not a list")
+
+        # Parse each category
+        categories = []
+        for cat_data in categories_data:
+            try:
+                # Map API fields to our Category model
+                category_dict = {
+                    "id": cat_data.get("id"),
+                    "name": cat_data.get("categoryId"),
+                    "display_name": cat_data.get("categoryName"),
+                }
+                category = Category.from_api_response(category_dict)
+                categories.append(category)
+            except (ValueError, KeyError) as e:
+                logger.warning(f"Failed to parse category: {e}")
+                continue
+
+        logger.info(f"Fetched {len(categories)} categories")
+        return categories
 
     async def get_stories(
         self, category_id: str, limit: int = 12
@@ -180,75 +382,136 @@ class APIClient:
         # Validate limit
         limit = max(1, min(100, limit))
 
-        endpoint = (
-            f"{self.base_url}/api/batches/latest/categories/{category_id}/stories"
+        return await self._coalesce(
+            ("stories", category_id, limit), self._fetch_stories, category_id, limit
         )
-        params = {"limit": limit}
 
+    async def iter_stories_for_categories(
+        self, category_ids: list[str], limit: int = 12
+    ) -> AsyncIterator[tuple[str, tuple[list[Story], str] | APIError]]:
+        """Fetch stories for several categories, yielding each as it completes.
+
+        At most MAX_CONCURRENT_FETCHES requests are in flight at once, shared
+        with any other concurrent calls on this client. Requests still pending
+        when the caller stops iterating are cancelled.
+
+        Args:
+            category_ids: Category UUIDs (from Category.id field)
+            limit: Maximum number of stories per category (1-100, default 12)
+
+        Yields:
+            Tuples of (category UUID, result) in completion order, where result
+            is either a tuple of (list of Story objects, batch ID) or the
+            APIError raised for that category
+        """
+        tasks = [
+            asyncio.ensure_future(_fetch_one(self, category_id, limit))
+            for category_id in category_ids
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _parse_stories(self, content: bytes) -> tuple[list[Story], str]:
+        """Parse a stories response into Story objects.
+
+        Well-formed responses are decoded straight into typed structs when
+        msgspec is installed; anything not matching the schema falls back to
+        lenient per-story parsing, which skips individual bad stories.
+
+        Args:
+            content: Raw response body
+
+        Returns:
+            Tuple of (list of Story objects, batch ID)
+
+        Raises:
+            APIResponseError: If the stories field is not a list
+            ValueError: If the body is not valid JSON
+        """
+        if schema is not None:
+            try:
+                response_data = schema.decode_stories(content)
+            except schema.ValidationError as e:
+                logger.debug(f"Stories response doesn't match schema: {e}")
+            else:
+                stories = []
+                for cluster in response_data.stories:
+                    if not cluster.articles:
+                        logger.warning("Story has no articles, skipping")
+                        continue
+                    stories.append(cluster.to_story())
+                return stories, response_data.batchId
+
+        # Decode lazily so only the fields read below are materialized
+        data = stories_data = story_data = None
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(endpoint, params=params)
-                response.raise_for_status()
-                data = response.json()
+            data = self._decode(content, lazy=True)
 
             # Extract batch ID and stories array from response
             batch_id = data.get("batchId", "")
             stories_data = data.get("stories", [])
 
-            if not isinstance(stories_data, list):
-                raise APIResponseError("Invalid response format: stories is not a list")
+            if not isinstance(stories_data, JSON_ARRAY_TYPES):
+                raise APIResponseError(
+                    "Invalid response format: stories is not a list"
+                )
 
-            # Parse each story
+            # Parse each story cluster straight into our Story model
             stories = []
             for story_data in stories_data:
-                try:
-                    # Map API story cluster to our Story model
-                    # Use the first article from the cluster for URL, source, and date
-                    articles = story_data.get("articles", [])
-                    if not articles:
-                        logger.warning("Story has no articles, skipping")
-                        continue
-
-                    first_article = articles[0]
+                if not story_data.get("articles"):
+                    logger.warning("Story has no articles, skipping")
+                    continue
 
-                    # Build story dictionary for our model
-                    story_dict = {
-                        "id": story_data.get(
-                            "id", str(story_data.get("cluster_number", "unknown"))
-                        ),
-                        "title": story_data.get("title"),
-                        "url": first_article.get("link"),
-                        "source": first_article.get("domain"),
-                        "published_at": first_article.get("date"),
-                        "excerpt": story_data.get("short_summary"),
-                    }
+                try:
+                    stories.append(Story.from_api_cluster(story_data))
+                except ValueError as e:
+                    logger.warning(f"Failed to parse story: {e}")
+        finally:
+            # Lazy proxies keep the shared parser locked while they exist, and
+            # a raised exception's traceback would keep this frame's alive
+            data = stories_data = story_data = None
 
-                    story = Story.from_api_response(story_dict)
-                    stories.append(story)
+        return stories, batch_id
 
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Failed to parse story: {e}")
-                    continue
+    async def _fetch_stories(
+        self, category_id: str, limit: int
+    ) -> tuple[list[Story], str]:
+        """Request stories for a category (see get_stories)."""
+        endpoint = (
+            f"{self.base_url}/api/batches/latest/categories/{category_id}/stories"
+        )
+        stories, batch_id = await self._get_json(
+            endpoint, self._parse_stories, params={"limit": limit}
+        )
 
-            logger.info(
-                f"Fetched {len(stories)} stories for category {category_id} (batch: {batch_id})"
-            )
-            return stories, batch_id
+        logger.info(
+            f"Fetched {len(stories)} stories for category {category_id} (batch: {batch_id})"
+        )
+        return stories, batch_id
 
-        except httpx.TimeoutException as e:
-            logger.error(f"Request timed out: {e}")
-            raise APITimeoutError(
-                f"Request to {endpoint} timed out after {self.timeout}s"
-            ) from e
 
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e}")
-            raise APIError(f"HTTP {e.response.status_code}: {e}") from e
+async def _fetch_one(
+    api: APIClient, category_id: str, limit: int
+) -> tuple[str, tuple[list[Story], str] | APIError]:
+    """Fetch one category's stories under the client's concurrency limit.
 
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
-            raise APIError(f"Failed to connect to {endpoint}: {e}") from e
+    Args:
+        api: Client to fetch with
+        category_id: Category UUID
+        limit: Maximum number of stories
 
-        except (ValueError, KeyError) as e:
-            logger.error(f"Failed to parse response: {e}")
-            raise APIResponseError(f"Malformed API response: {e}") from e
+    Returns:
+        Tuple of (category UUID, result), where result is either a tuple of
+        (list of Story objects, batch ID) or the APIError raised for it
+    """
+    async with api._fetch_semaphore:
+        try:
+            return category_id, await api.get_stories(category_id, limit)
+        except APIError as e:
+            # Per-category API failures are returned; anything else is a bug
+            return category_id, e
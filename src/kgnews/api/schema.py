@@ -0,0 +1,81 @@
+"""Typed msgspec schemas for decoding Kagi News API responses.
+
+Requires the optional msgspec package. Fields the app doesn't use are
+ignored during decoding, and any response not matching the schema raises
+ValidationError so callers can fall back to lenient parsing.
+"""
+
+from datetime import datetime
+
+import msgspec
+
+from kgnews.models import Story
+
+ValidationError = msgspec.ValidationError
+
+
+class Article(msgspec.Struct):
+    """A source article within a story cluster."""
+
+    link: str
+    domain: str
+    date: datetime
+
+
+class Cluster(msgspec.Struct):
+    """A story cluster grouping articles about the same event."""
+
+    title: str
+    id: str | None = None
+    cluster_number: int | None = None
+    short_summary: str | None = None
+    articles: list[Article] = []
+
+    def to_story(self) -> Story:
+        """Convert to a Story using the first article for URL, source, and date.
+
+        Returns:
+            Story instance
+        """
+        article = self.articles[0]
+        if self.id is not None:
+            story_id = self.id
+        elif self.cluster_number is not None:
+            story_id = str(self.cluster_number)
+        else:
+            story_id = "unknown"
+
+        return Story(
+            id=story_id,
+            title=self.title,
+            url=article.link,
+            source=article.domain,
+            published_at=article.date,
+            excerpt=self.short_summary or None,
+        )
+
+
+class StoriesResponse(msgspec.Struct):
+    """Response body of the category stories endpoint."""
+
+    batchId: str = ""
+    stories: list[Cluster] = []
+
+
+_stories_decoder = msgspec.json.Decoder(StoriesResponse)
+
+
+def decode_stories(content: bytes) -> StoriesResponse:
+    """Decode a category stories response.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        Decoded StoriesResponse
+
+    Raises:
+        ValidationError: If the response doesn't match the schema
+        ValueError: If the body is not valid JSON
+    """
+    return _stories_decoder.decode(content)
@@ -5,6 +5,7 @@ import logging
 from textual.app import App
 from textual.binding import Binding
 
+from kgnews.api import APIClient
 from kgnews.config import ConfigManager
 from kgnews.ui.screens import ConfigScreen, MainScreen
 
@@ -26,7 +27,6 @@ class KagiNewsApp(App):
 
     # Install screens
     SCREENS = {
-        "main": MainScreen,
         "config": ConfigScreen,
     }
 
@@ -46,17 +46,24 @@ class KagiNewsApp(App):
         "textual-ansi",
     ]
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the application and its shared services."""
+        super().__init__(*args, **kwargs)
+        # Single API client for the app lifetime so HTTP connections are pooled
+        self.api_client = APIClient()
+        # Single config manager so the loaded config stays cached across screens
+        self.config_manager = ConfigManager()
+
     def on_mount(self) -> None:
         """Initialize the application and navigate to main screen."""
         logger.info("Application starting")
 
         # Load and apply theme
-        config_manager = ConfigManager()
-        config = config_manager.load()
+        config = self.config_manager.load()
         self._apply_theme(config.theme)
 
-        # Navigate to the main screen
-        self.push_screen("main")
+        # Navigate to the main screen, sharing the pooled API client
+        self.push_screen(MainScreen(api_client=self.api_client))
 
     def _apply_theme(self, theme_name: str) -> None:
         """Apply the specified theme.
@@ -82,14 +89,17 @@ class KagiNewsApp(App):
         if result:
             logger.info("Configuration saved, refreshing main screen")
 
-            # Reload and apply theme
-            config_manager = ConfigManager()
-            config = config_manager.load()
+            # Apply saved theme (cached by the shared config manager)
+            config = self.config_manager.load()
             self._apply_theme(config.theme)
 
             # Pop current screen and push a fresh MainScreen
             self.pop_screen()
-            self.push_screen("main")
+            self.push_screen(MainScreen(api_client=self.api_client))
+
+    async def on_unmount(self) -> None:
+        """Release pooled HTTP connections when the application shuts down."""
+        await self.api_client.aclose()
 
     def action_quit(self) -> None:
         """Quit the application."""
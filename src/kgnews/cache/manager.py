@@ -1,15 +1,29 @@
 """Cache manager for news stories."""
 
-import json
+import asyncio
 import logging
+import os
 import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from kgnews.models import Story
+from kgnews.utils import json
+
+try:
+    import zstandard
+except ImportError:  # zstandard is an optional speedup
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
+# Errors raised when a compressed cache file is corrupt
+DECOMPRESS_ERRORS: tuple[type[Exception], ...] = (
+    (zstandard.ZstdError,) if zstandard else ()
+)
+
 
 class CacheManager:
     """Manages caching of news stories by category and batch ID.
@@ -18,6 +32,12 @@ class CacheManager:
     """
 
     CACHE_DIR = Path(tempfile.gettempdir()) / "kaginews_cache"
+    MEMORY_CACHE_SIZE = 16  # Parsed story lists kept in memory
+    # Cache files are zstd-compressed JSON when zstandard is installed
+    CACHE_SUFFIX = ".json.zst" if zstandard else ".json"
+
+    # Cache directories already created by this process
+    _ensured_dirs: ClassVar[set[Path]] = set()
 
     def __init__(self, cache_dir: Path | None = None):
         """Initialize cache manager.
@@ -26,7 +46,15 @@ class CacheManager:
             cache_dir: Directory for cache storage (defaults to /tmp/kaginews_cache)
         """
         self.cache_dir = cache_dir or self.CACHE_DIR
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if self.cache_dir not in CacheManager._ensured_dirs:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            CacheManager._ensured_dirs.add(self.cache_dir)
+
+        # Parsed stories keyed by (category, batch, file mtime) so repeated
+        # lookups skip disk I/O; the mtime invalidates entries on rewrite
+        self._memory_cache: dict[tuple[str, str, int], list[Story]] = {}
+        # Guards the memory cache, since the async wrappers run in worker threads
+        self._memory_lock = threading.Lock()
 
     def _get_cache_path(self, category_id: str, batch_id: str) -> Path:
         """Get cache file path for a category and batch.
@@ -38,7 +66,34 @@ class CacheManager:
         Returns:
             Path to cache file
         """
-        return self.cache_dir / f"{category_id}_{batch_id}.json"
+        return self._make_path(self.cache_dir, category_id, batch_id)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _make_path(cache_dir: Path, category_id: str, batch_id: str) -> Path:
+        """Build a cache file path, memoized per (directory, category, batch).
+
+        Args:
+            cache_dir: Directory for cache storage
+            category_id: Category UUID
+            batch_id: Batch UUID
+
+        Returns:
+            Path to cache file
+        """
+        return cache_dir / f"{category_id}_{batch_id}{CacheManager.CACHE_SUFFIX}"
+
+    def _remember(self, key: tuple[str, str, int], stories: list[Story]) -> None:
+        """Store parsed stories in the in-memory cache, evicting the oldest entry.
+
+        Args:
+            key: Tuple of (category ID, batch ID, cache file mtime in ns)
+            stories: Parsed stories for that cache file
+        """
+        with self._memory_lock:
+            if len(self._memory_cache) >= self.MEMORY_CACHE_SIZE:
+                del self._memory_cache[next(iter(self._memory_cache))]
+            self._memory_cache[key] = stories
 
     def get_cached_stories(self, category_id: str, batch_id: str) -> list[Story] | None:
         """Retrieve cached stories for a category and batch.
@@ -52,13 +107,23 @@ class CacheManager:
         """
         cache_path = self._get_cache_path(category_id, batch_id)
 
-        if not cache_path.exists():
+        try:
+            mtime_ns = cache_path.stat().st_mtime_ns
+        except OSError:
             logger.debug(f"No cache found for category {category_id}, batch {batch_id}")
             return None
 
+        # Serve from memory if this exact file version was already parsed
+        key = (category_id, batch_id, mtime_ns)
+        cached = self._memory_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            blob = cache_path.read_bytes()
+            if zstandard:
+                blob = zstandard.decompress(blob)
+            data = json.loads(blob)
 
             # Validate cache structure
             if not isinstance(data, dict) or "stories" not in data:
@@ -78,9 +143,10 @@ class CacheManager:
             logger.info(
                 f"Loaded {len(stories)} stories from cache for category {category_id}"
             )
+            self._remember(key, stories)
             return stories
 
-        except (json.JSONDecodeError, OSError) as e:
+        except (json.JSONDecodeError, OSError, *DECOMPRESS_ERRORS) as e:
             logger.error(f"Failed to read cache file {cache_path}: {e}")
             return None
 
@@ -98,17 +164,7 @@ class CacheManager:
 
         try:
             # Convert stories to serializable format
-            stories_data = []
-            for story in stories:
-                story_dict = {
-                    "id": story.id,
-                    "title": story.title,
-                    "url": story.url,
-                    "source": story.source,
-                    "published_at": story.published_at.isoformat(),
-                    "excerpt": story.excerpt,
-                }
-                stories_data.append(story_dict)
+            stories_data = [story.to_dict() for story in stories]
 
             # Save to cache
             cache_data = {
@@ -117,8 +173,17 @@ class CacheManager:
                 "stories": stories_data,
             }
 
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2)
+            # Write compact JSON to a temp file and swap it in atomically so a
+            # crash mid-write never leaves a truncated cache file behind
+            blob = json.dumps(cache_data)
+            if zstandard:
+                blob = zstandard.compress(blob, level=3)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+            tmp_path.write_bytes(blob)
+            os.replace(tmp_path, cache_path)
+            self._remember(
+                (category_id, batch_id, cache_path.stat().st_mtime_ns), stories
+            )
 
             logger.info(
                 f"Cached {len(stories)} stories for category {category_id}, batch {batch_id}"
@@ -127,25 +192,45 @@ class CacheManager:
         except (OSError, TypeError) as e:
             logger.error(f"Failed to save cache to {cache_path}: {e}")
 
+    async def aget_cached_stories(
+        self, category_id: str, batch_id: str
+    ) -> list[Story] | None:
+        """Retrieve cached stories without blocking the event loop.
+
+        Runs get_cached_stories in a worker thread.
+
+        Args:
+            category_id: Category UUID
+            batch_id: Batch UUID
+
+        Returns:
+            List of Story objects if cache exists and is valid, None otherwise
+        """
+        return await asyncio.to_thread(self.get_cached_stories, category_id, batch_id)
+
     def clear_old_caches(self, current_batch_id: str) -> None:
         """Remove cache files from previous batches.
 
         Args:
             current_batch_id: The current batch ID to keep
         """
-        if not self.cache_dir.exists():
-            return
-
         try:
             removed_count = 0
-            for cache_file in self.cache_dir.glob("*.json"):
-                # Check if file name contains the current batch ID
-                if current_batch_id not in cache_file.name:
-                    cache_file.unlink()
-                    removed_count += 1
+            # scandir yields names without a stat() per entry
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    # Match compressed, plain, and leftover temp cache files alike,
+                    # keeping any whose name contains the current batch ID
+                    name = entry.name
+                    if ".json" in name and current_batch_id not in name:
+                        os.unlink(entry.path)
+                        removed_count += 1
 
             if removed_count > 0:
                 logger.info(f"Removed {removed_count} old cache files")
 
+        except FileNotFoundError:
+            return
+
         except OSError as e:
             logger.error(f"Failed to clear old caches: {e}")
@@ -1,10 +1,11 @@
 """Configuration management for Kagi News Reader."""
 
-import json
+import asyncio
 import logging
 from pathlib import Path
 
 from kgnews.models import Config
+from kgnews.utils import json
 
 logger = logging.getLogger(__name__)
 
@@ -50,8 +51,7 @@ class ConfigManager:
 
         try:
             # Read and parse JSON
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json.loads(self.config_path.read_bytes())
 
             # Create Config from dictionary
             self._config = Config.from_dict(data)
@@ -72,21 +72,33 @@ class ConfigManager:
             self._config = Config.default()
             return self._config
 
-    def save(self, config: Config) -> None:
+    async def aload(self) -> Config:
+        """Load configuration without blocking the event loop.
+
+        Returns the cached config directly; otherwise runs load in a worker thread.
+
+        Returns:
+            Config instance
+        """
+        if self._config is not None:
+            return self._config
+        return await asyncio.to_thread(self.load)
+
+    def save(self, config: Config, pretty: bool = False) -> None:
         """Save configuration to config.json.
 
         Creates the file if it doesn't exist.
 
         Args:
             config: Config instance to save
+            pretty: Indent the JSON for human readability (defaults to compact)
         """
         try:
             # Ensure parent directory exists
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write JSON with pretty formatting
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(config.to_dict(), f, indent=2, ensure_ascii=False)
+            # Write JSON, compact unless pretty output was requested
+            self.config_path.write_bytes(json.dumps(config.to_dict(), indent=pretty))
 
             # Update cached config
             self._config = config
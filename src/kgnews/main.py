@@ -3,8 +3,6 @@
 import logging
 import sys
 
-from kgnews.app import KagiNewsApp
-
 # Configure logging - only to file to avoid breaking TUI
 logging.basicConfig(
     level=logging.INFO,
@@ -21,6 +19,10 @@ def main() -> None:
     """Launch the Kagi News Reader application."""
     try:
         logger.info("Starting Kagi News Reader")
+
+        # Imported here so Textual is only loaded when the TUI actually starts
+        from kgnews.app import KagiNewsApp
+
         app = KagiNewsApp()
         app.run()
     except KeyboardInterrupt:
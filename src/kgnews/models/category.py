@@ -1,9 +1,15 @@
 """Category data model for Kagi News."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+# Fields that must be present in category dictionaries
+_REQUIRED_FIELDS = frozenset(("id", "name", "display_name"))
 
-@dataclass
+# Characters not allowed in Textual widget IDs, mapped to underscores
+_ID_SANITIZE = str.maketrans({"|": "_", "(": "_", ")": "_", " ": "_"})
+
+
+@dataclass(slots=True)
 class Category:
     """Represents a news category.
 
@@ -11,11 +17,17 @@ class Category:
         id: Batch-specific UUID for the category (changes with each batch)
         name: Stable category identifier (e.g., "tech", "science") - use this for matching
         display_name: Human-readable category name for display (e.g., "Technology", "Science")
+        safe_id: name with characters invalid in widget IDs replaced by underscores
     """
 
     id: str
     name: str
     display_name: str
+    safe_id: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the widget-safe ID once at construction."""
+        self.safe_id = self.name.translate(_ID_SANITIZE)
 
     @classmethod
     def from_api_response(cls, data: dict) -> "Category":
@@ -32,11 +44,12 @@ class Category:
         """
         try:
             # Validate required fields
-            required_fields = ["id", "name", "display_name"]
-            missing_fields = [field for field in required_fields if field not in data]
+            missing_fields = _REQUIRED_FIELDS - data.keys()
 
             if missing_fields:
-                raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
+                raise ValueError(
+                    f"Missing required fields: {', '.join(sorted(missing_fields))}"
+                )
 
             return cls(
                 id=str(data["id"]),
@@ -1,11 +1,187 @@
 """Story data model for Kagi News."""
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import ClassVar
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, ClassVar
 
 
-@dataclass
+# Fields that must be present in API and cache story dictionaries
+_REQUIRED_FIELDS = frozenset(("id", "title", "url", "source", "published_at"))
+
+_ONE_MINUTE = timedelta(minutes=1)
+
+# Titles longer than this are truncated with "..." for display
+_MAX_TITLE_LENGTH = 80
+
+
+def _s(value: Any) -> str:
+    """Coerce a value to str, skipping the call when it already is one.
+
+    Args:
+        value: Field value from a decoded payload
+
+    Returns:
+        The value itself if it is exactly a str, otherwise str(value)
+    """
+    return value if type(value) is str else str(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, memoized since many stories share one.
+
+    Args:
+        value: ISO 8601 string, optionally with a trailing 'Z'
+
+    Returns:
+        Parsed datetime
+
+    Raises:
+        ValueError: If the string is not valid ISO 8601
+    """
+    # fromisoformat accepts a trailing 'Z' natively since Python 3.11
+    return datetime.fromisoformat(value)
+
+
+def _parse_published_at(value: Any) -> datetime:
+    """Parse a publication timestamp in any of the supported formats.
+
+    Args:
+        value: ISO 8601 string, numeric timestamp (or numeric string), or datetime
+
+    Returns:
+        Parsed datetime
+
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    if isinstance(value, str):
+        # Try ISO format first
+        try:
+            return _parse_iso_datetime(value)
+        except ValueError:
+            # Try parsing as timestamp if it's a numeric string
+            try:
+                return datetime.fromtimestamp(float(value))
+            except (ValueError, TypeError):
+                raise ValueError(f"Invalid datetime format: {value}")
+    elif isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+    elif isinstance(value, datetime):
+        return value
+    raise ValueError(f"Invalid datetime type: {type(value)}")
+
+
+def _format_recent(dt: datetime, diff: timedelta) -> str:
+    """Format a same-day story as minutes or hours ago."""
+    if diff.seconds < 60:
+        return "just now"
+    hours, remainder = divmod(diff.seconds, 3600)
+    if hours == 0:
+        return f"{remainder // 60}m ago"
+    return f"{hours}h ago"
+
+
+def _format_yesterday(dt: datetime, diff: timedelta) -> str:
+    """Format a story from the previous day."""
+    return "yesterday"
+
+
+def _format_days(dt: datetime, diff: timedelta) -> str:
+    """Format a story from earlier this week as days ago."""
+    return f"{diff.days}d ago"
+
+
+def _format_absolute(dt: datetime, diff: timedelta) -> str:
+    """Format an older story as its absolute date."""
+    return dt.strftime("%Y-%m-%d")
+
+
+# Day boundaries for bisect, and the formatter for each interval between them.
+# Timestamps in the future (negative days) keep the "Nd ago" form.
+_DAY_THRESHOLDS = (0, 1, 2, 7)
+_DAY_FORMATTERS = (
+    _format_days,
+    _format_recent,
+    _format_yesterday,
+    _format_days,
+    _format_absolute,
+)
+
+
+def _format_time(dt: datetime, now: datetime | None = None) -> str:
+    """Format datetime for display.
+
+    Args:
+        dt: Datetime to format
+        now: Current time, naive or aware to match dt
+            (defaults to datetime.now() in dt's timezone)
+
+    Returns:
+        Formatted time string
+    """
+    if now is None:
+        now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
+    diff = now - dt
+
+    # Relative time for recent stories, absolute date for older ones
+    return _DAY_FORMATTERS[bisect_right(_DAY_THRESHOLDS, diff.days)](dt, diff)
+
+
+@lru_cache(maxsize=4096)
+def _format_display_cached(
+    display_title: str, source: str, published_at: datetime, minutes_ago: int
+) -> str:
+    """Build a story's display line for a given whole-minute age.
+
+    Args:
+        display_title: Story headline, already truncated for display
+        source: News source/publisher
+        published_at: Publication timestamp
+        minutes_ago: Whole minutes elapsed since publication
+
+    Returns:
+        Formatted string with title, source, and timestamp
+    """
+    # Format timestamp as relative time or absolute
+    time_str = _format_time(published_at, published_at + minutes_ago * _ONE_MINUTE)
+    return f"{display_title} | {source} | {time_str}"
+
+
+@lru_cache(maxsize=256)
+def _format_expanded_cached(story: "Story", minutes_ago: int) -> str:
+    """Build a story's expanded detail markup for a given whole-minute age.
+
+    Args:
+        story: Story to describe
+        minutes_ago: Whole minutes elapsed since publication
+
+    Returns:
+        Rich markup with title, source, timestamp, URL, and excerpt
+    """
+    published_at = story.published_at
+    time_str = _format_time(published_at, published_at + minutes_ago * _ONE_MINUTE)
+
+    lines = [
+        f"[bold]{story.title}[/bold]",
+        f"[dim]Source: {story.source} | {time_str}[/dim]",
+        f"[dim]URL: {story.url}[/dim]",
+    ]
+
+    # Add excerpt/summary if available
+    if story.excerpt:
+        lines.append("")  # Blank line
+        lines.append(f"[italic]{story.excerpt}[/italic]")
+
+    lines.append("")  # Blank line
+    lines.append("[dim]Press Enter to collapse[/dim]")
+
+    return "\n".join(lines)
+
+
+@dataclass(slots=True, frozen=True)
 class Story:
     """Represents a news story from Kagi News.
 
@@ -24,6 +200,17 @@ class Story:
     source: str
     published_at: datetime
     excerpt: str | None = None
+    _display_title: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Truncate the title for display once, since it never changes."""
+        # Truncate title if too long for better display
+        display_title = self.title
+        if len(display_title) > _MAX_TITLE_LENGTH:
+            display_title = display_title[:_MAX_TITLE_LENGTH - 3] + "..."
+
+        # Frozen dataclass, so bypass the generated __setattr__
+        object.__setattr__(self, "_display_title", display_title)
 
     @classmethod
     def from_api_response(cls, data: dict) -> "Story":
@@ -40,36 +227,22 @@ class Story:
         """
         try:
             # Validate required fields
-            required_fields = ["id", "title", "url", "source", "published_at"]
-            missing_fields = [field for field in required_fields if field not in data]
+            missing_fields = _REQUIRED_FIELDS - data.keys()
 
             if missing_fields:
-                raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
-
-            # Parse published_at - handle various datetime formats
-            published_at = data["published_at"]
-            if isinstance(published_at, str):
-                # Try ISO format first
-                try:
-                    published_at = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                except ValueError:
-                    # Try parsing as timestamp if it's a numeric string
-                    try:
-                        published_at = datetime.fromtimestamp(float(published_at))
-                    except (ValueError, TypeError):
-                        raise ValueError(f"Invalid datetime format: {published_at}")
-            elif isinstance(published_at, (int, float)):
-                published_at = datetime.fromtimestamp(published_at)
-            elif not isinstance(published_at, datetime):
-                raise ValueError(f"Invalid datetime type: {type(published_at)}")
+                raise ValueError(
+                    f"Missing required fields: {', '.join(sorted(missing_fields))}"
+                )
+
+            excerpt = data.get("excerpt")
 
             return cls(
-                id=str(data["id"]),
-                title=str(data["title"]),
-                url=str(data["url"]),
-                source=str(data["source"]),
-                published_at=published_at,
-                excerpt=str(data["excerpt"]) if "excerpt" in data and data["excerpt"] else None,
+                id=_s(data["id"]),
+                title=_s(data["title"]),
+                url=_s(data["url"]),
+                source=_s(data["source"]),
+                published_at=_parse_published_at(data["published_at"]),
+                excerpt=_s(excerpt) if excerpt else None,
             )
 
         except KeyError as e:
@@ -77,49 +250,105 @@ class Story:
         except (TypeError, AttributeError) as e:
             raise ValueError(f"Invalid data structure: {e}")
 
-    def format_display(self) -> str:
+    @classmethod
+    def from_api_cluster(cls, cluster: Any) -> "Story":
+        """Create Story directly from an API story cluster.
+
+        The cluster's first article supplies the URL, source, and date.
+
+        Args:
+            cluster: Story cluster mapping (dict or lazy simdjson object)
+
+        Returns:
+            Story instance
+
+        Raises:
+            ValueError: If required fields are missing or invalid
+        """
+        try:
+            article = cluster["articles"][0]
+            excerpt = cluster.get("short_summary")
+
+            return cls(
+                id=_s(cluster.get("id", cluster.get("cluster_number", "unknown"))),
+                title=_s(cluster["title"]),
+                url=_s(article["link"]),
+                source=_s(article["domain"]),
+                published_at=_parse_published_at(article["date"]),
+                excerpt=_s(excerpt) if excerpt else None,
+            )
+
+        except (KeyError, IndexError) as e:
+            raise ValueError(f"Missing required field: {e}")
+        except (TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid data structure: {e}")
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization.
+
+        Returns:
+            Dictionary representation accepted by from_api_response
+        """
+        return {
+            "id": self.id,
+            "title": self.title,
+            "url": self.url,
+            "source": self.source,
+            "published_at": self.published_at.isoformat(),
+            "excerpt": self.excerpt,
+        }
+
+    def format_display(self, now: datetime | None = None) -> str:
         """Format story for display in TUI.
 
+        Args:
+            now: Current time to measure relative timestamps against
+                (defaults to datetime.now() in the story's timezone)
+
         Returns:
             Formatted string with title, source, and timestamp
         """
-        # Format timestamp as relative time or absolute
-        time_str = self._format_time(self.published_at)
+        if now is None:
+            tz = self.published_at.tzinfo
+            now = datetime.now(tz) if tz else datetime.now()
 
-        # Truncate title if too long for better display
-        max_title_length = 80
-        display_title = self.title
-        if len(display_title) > max_title_length:
-            display_title = display_title[:max_title_length - 3] + "..."
+        # The output only changes once per elapsed minute, so memoize on that
+        minutes_ago = (now - self.published_at) // _ONE_MINUTE
+        return _format_display_cached(
+            self._display_title, self.source, self.published_at, minutes_ago
+        )
+
+    def format_expanded(self, now: datetime | None = None) -> str:
+        """Format story details for the expanded view in TUI.
+
+        Args:
+            now: Current time to measure relative timestamps against
+                (defaults to datetime.now() in the story's timezone)
+
+        Returns:
+            Rich markup with title, source, timestamp, URL, and excerpt
+        """
+        if now is None:
+            tz = self.published_at.tzinfo
+            now = datetime.now(tz) if tz else datetime.now()
 
-        return f"{display_title} | {self.source} | {time_str}"
+        # Like format_display, the output only changes once per elapsed minute
+        minutes_ago = (now - self.published_at) // _ONE_MINUTE
+        return _format_expanded_cached(self, minutes_ago)
 
-    def _format_time(self, dt: datetime) -> str:
-        """Format datetime for display.
+    @classmethod
+    def format_batch(cls, stories: list["Story"]) -> list[str]:
+        """Format several stories for display, reading the clock only once.
 
         Args:
-            dt: Datetime to format
+            stories: Stories to format
 
         Returns:
-            Formatted time string
+            Formatted display strings, in the same order as stories
         """
-        now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
-        diff = now - dt
-
-        # Show relative time for recent stories
-        if diff.days == 0:
-            hours = diff.seconds // 3600
-            minutes = (diff.seconds % 3600) // 60
-
-            if hours == 0:
-                if minutes == 0:
-                    return "just now"
-                return f"{minutes}m ago"
-            return f"{hours}h ago"
-        elif diff.days == 1:
-            return "yesterday"
-        elif diff.days < 7:
-            return f"{diff.days}d ago"
-        else:
-            # Show absolute date for older stories
-            return dt.strftime("%Y-%m-%d")
+        now_naive = datetime.now()
+        now_aware = datetime.now(timezone.utc)
+        return [
+            story.format_display(now_aware if story.published_at.tzinfo else now_naive)
+            for story in stories
+        ]
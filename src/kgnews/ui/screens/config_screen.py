@@ -1,33 +1,46 @@
 """Configuration screen for selecting news categories."""
 
+import dataclasses
 import logging
+import textwrap
+from typing import Callable, ClassVar
 
 from textual import events
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Button, Checkbox, Footer, Label, Select, Static
 
 from kgnews.api import APIClient, APIError
 from kgnews.config import ConfigManager
-from kgnews.models import Category
+from kgnews.models import Category, Config
 
 logger = logging.getLogger(__name__)
 
-
-class ConfigScreen(Screen):
-    """Configuration screen for selecting news categories.
-
-    Allows users to select which categories to display in the main screen.
+# Available themes from the app
+_AVAILABLE_THEMES = (
+    "textual-dark",
+    "textual-light",
+    "nord",
+    "gruvbox",
+    "monokai",
+    "dracula",
+    "catppuccin-mocha",
+    "catppuccin-latte",
+    "solarized-light",
+    "tokyo-night",
+    "flexoki",
+    "textual-ansi",
+)
+
+# Delay before previewing a selected theme, so rapid changes apply only once
+_THEME_PREVIEW_DELAY = 0.1
+
+# Screen stylesheet, dedented once at import time
+_CONFIG_CSS = textwrap.dedent(
     """
-
-    BINDINGS = [
-        Binding("ctrl+s", "save", "Save"),
-        Binding("escape", "cancel", "Cancel"),
-    ]
-
-    CSS = """
     #category-container {
         height: 1fr;
         margin: 1 0;
@@ -73,34 +86,50 @@ class ConfigScreen(Screen):
         border: solid $accent;
     }
     """
+)
+
+
+class ConfigScreen(Screen):
+    """Configuration screen for selecting news categories.
+
+    Allows users to select which categories to display in the main screen.
+    """
+
+    BINDINGS = [
+        Binding("ctrl+s", "save", "Save"),
+        Binding("escape", "cancel", "Cancel"),
+    ]
+
+    # Theme select options as (label, value) tuples, built once
+    _THEME_OPTIONS: ClassVar[list[tuple[str, str]]] = [
+        (name, name) for name in _AVAILABLE_THEMES
+    ]
+
+    CSS: ClassVar[str] = _CONFIG_CSS
 
     def __init__(self, *args, **kwargs):
         """Initialize the ConfigScreen."""
         super().__init__(*args, **kwargs)
-        self.api_client = APIClient()
-        self.config_manager = ConfigManager()
+        self.api_client: APIClient = self.app.api_client
+        self.config_manager: ConfigManager = self.app.config_manager
+        # Theme hook looked up once; None if the app does not support previews
+        self._apply_theme_fn: Callable[[str], None] | None = getattr(
+            self.app, "_apply_theme", None
+        )
         self.categories: list[Category] = []
-        self.checkboxes: dict[str, Checkbox] = {}
+        # Checkboxes in the same order as self.categories, for index lookups
+        self._checkbox_by_index: list[Checkbox] = []
         self._container: VerticalScroll | None = None
         self._loading_label: Label | None = None
         self._theme_select: Select | None = None
         self._original_theme: str | None = None  # Store original theme for cancel
+        self._prev_highlighted_index: int | None = None  # Only checkbox to un-highlight
+        self._pending_theme: str | None = None  # Theme waiting for debounced preview
+        self._theme_timer: Timer | None = None
+        self._config: Config | None = None  # Config loaded on mount, reused on save
 
         # Available themes from the app
-        self.available_themes = [
-            "textual-dark",
-            "textual-light",
-            "nord",
-            "gruvbox",
-            "monokai",
-            "dracula",
-            "catppuccin-mocha",
-            "catppuccin-latte",
-            "solarized-light",
-            "tokyo-night",
-            "flexoki",
-            "textual-ansi",
-        ]
+        self.available_themes = _AVAILABLE_THEMES
 
     def compose(self) -> ComposeResult:
         """Compose the configuration screen layout."""
@@ -118,14 +147,13 @@ class ConfigScreen(Screen):
             # Theme selection section
             with Vertical(id="theme-section"):
                 yield Label("Theme")
-                # Create options as tuples of (label, value)
-                theme_options = [(name, name) for name in self.available_themes]
-                yield Select(
-                    options=theme_options,
+                self._theme_select = Select(
+                    options=self._THEME_OPTIONS,
                     value="textual-dark",
                     id="theme-select",
                     allow_blank=False,
                 )
+                yield self._theme_select
 
             # Buttons
             with Horizontal(id="button-row"):
@@ -142,7 +170,7 @@ class ConfigScreen(Screen):
             self.categories = await self.api_client.get_categories()
 
             # Load current selections from config
-            config = self.config_manager.load()
+            config = self._config = await self.config_manager.aload()
             selected_ids = set(config.selected_categories)
 
             # Store original theme for cancel functionality
@@ -150,9 +178,8 @@ class ConfigScreen(Screen):
 
             # Set theme select based on current theme
             current_theme = config.theme
-            theme_select = self.query_one("#theme-select", Select)
             if current_theme in self.available_themes:
-                theme_select.value = current_theme
+                self._theme_select.value = current_theme
 
             # Hide loading label
             if self._loading_label:
@@ -161,38 +188,36 @@ class ConfigScreen(Screen):
             # Create checkboxes in rows of 3
             if self._container:
                 COLUMNS_PER_ROW = 3
-                current_row = None
-
-                for i, category in enumerate(self.categories):
-                    # Create a new row every COLUMNS_PER_ROW items
-                    if i % COLUMNS_PER_ROW == 0:
-                        current_row = Horizontal(classes="category-row")
-                        await self._container.mount(current_row)
+                rows: list[Horizontal] = []
+                row_children: list[Checkbox] = []
 
+                for category in self.categories:
                     # Check if this category is currently selected (use stable name, not UUID id)
                     is_selected = category.name in selected_ids
 
                     # Create checkbox - disable individual focus, navigation handled by container
-                    # Sanitize category name for use as ID (remove invalid characters like |, (), spaces)
-                    safe_id = (
-                        category.name.replace("|", "_")
-                        .replace("(", "_")
-                        .replace(")", "_")
-                        .replace(" ", "_")
-                    )
+                    # Use the sanitized name as ID (invalid characters like |, (), spaces replaced)
                     checkbox = Checkbox(
                         category.display_name,
                         value=is_selected,
-                        id=f"cat-{safe_id}",
+                        id=f"cat-{category.safe_id}",
                     )
                     checkbox.can_focus = False
 
-                    # Store reference to checkbox (use stable name as key)
-                    self.checkboxes[category.name] = checkbox
+                    # Store reference to checkbox at the category's index
+                    self._checkbox_by_index.append(checkbox)
+
+                    # Start a new row every COLUMNS_PER_ROW items
+                    row_children.append(checkbox)
+                    if len(row_children) == COLUMNS_PER_ROW:
+                        rows.append(Horizontal(*row_children, classes="category-row"))
+                        row_children = []
+
+                if row_children:
+                    rows.append(Horizontal(*row_children, classes="category-row"))
 
-                    # Mount checkbox to current row
-                    if current_row:
-                        await current_row.mount(checkbox)
+                # Mount the whole tree at once instead of one widget at a time
+                await self._container.mount_all(rows)
 
                 # Initialize highlighting for the first category
                 if self.categories:
@@ -224,20 +249,28 @@ class ConfigScreen(Screen):
         try:
             # Collect checked category IDs
             selected_ids = [
-                category_id
-                for category_id, checkbox in self.checkboxes.items()
+                category.name
+                for category, checkbox in zip(self.categories, self._checkbox_by_index)
                 if checkbox.value
             ]
 
-            # Get selected theme
-            theme_select = self.query_one("#theme-select", Select)
+            # Get selected theme, applying it now in place of any pending preview
+            theme_select = self._theme_select
             theme = theme_select.value if theme_select.value else "textual-dark"
-
-            # Load config, update both fields, and save
-            config = self.config_manager.load()
-            config.selected_categories = selected_ids
-            config.theme = theme
+            self._cancel_theme_preview()
+            if self._apply_theme_fn:
+                self._apply_theme_fn(theme)
+
+            # Save a copy of the config loaded at mount with both fields
+            # updated; the loaded one is the manager's shared cache, which
+            # must not change unless the save succeeds
+            config = dataclasses.replace(
+                self._config or self.config_manager.load(),
+                selected_categories=selected_ids,
+                theme=theme,
+            )
             self.config_manager.save(config)
+            self._config = config
 
             logger.info(
                 f"Saved configuration with {len(selected_ids)} categories and theme '{theme}'"
@@ -255,9 +288,11 @@ class ConfigScreen(Screen):
         """Cancel configuration and dismiss screen without saving."""
         logger.info("Configuration cancelled")
 
+        self._cancel_theme_preview()
+
         # Restore original theme if it was changed
-        if self._original_theme and hasattr(self.app, "_apply_theme"):
-            self.app._apply_theme(self._original_theme)
+        if self._original_theme and self._apply_theme_fn:
+            self._apply_theme_fn(self._original_theme)
             logger.info(f"Restored original theme: {self._original_theme}")
 
         self.dismiss(False)
@@ -277,12 +312,31 @@ class ConfigScreen(Screen):
             event: Select changed event
         """
         # Check if this is the theme select
-        if event.select.id == "theme-select" and event.value:
-            # Apply theme immediately for preview
-            theme_name = str(event.value)
-            if hasattr(self.app, "_apply_theme"):
-                self.app._apply_theme(theme_name)
-                logger.info(f"Applied theme preview: {theme_name}")
+        if event.select is self._theme_select and event.value:
+            # Debounce the preview so a burst of changes applies only the last theme
+            self._pending_theme = str(event.value)
+            if self._theme_timer is not None:
+                self._theme_timer.stop()
+            self._theme_timer = self.set_timer(
+                _THEME_PREVIEW_DELAY, self._apply_pending_theme
+            )
+
+    def _apply_pending_theme(self) -> None:
+        """Apply the most recently selected theme as a preview."""
+        self._theme_timer = None
+        theme_name = self._pending_theme
+        self._pending_theme = None
+
+        if theme_name and self._apply_theme_fn:
+            self._apply_theme_fn(theme_name)
+            logger.info(f"Applied theme preview: {theme_name}")
+
+    def _cancel_theme_preview(self) -> None:
+        """Discard any theme preview that has not been applied yet."""
+        if self._theme_timer is not None:
+            self._theme_timer.stop()
+            self._theme_timer = None
+        self._pending_theme = None
 
     def on_key(self, event: events.Key) -> None:
         """Handle key events for proper navigation.
@@ -344,22 +398,22 @@ class ConfigScreen(Screen):
         Args:
             index: Index of category to highlight
         """
-        if index < 0 or index >= len(self.categories):
+        if index < 0 or index >= len(self._checkbox_by_index):
             return
 
-        # Remove previous highlights
-        for category in self.categories:
-            checkbox = self.checkboxes.get(category.name)
-            if checkbox:
-                checkbox.remove_class("highlighted")
+        # Remove previous highlight (only one checkbox can have it)
+        if self._prev_highlighted_index is not None:
+            self._checkbox_by_index[self._prev_highlighted_index].remove_class(
+                "highlighted"
+            )
 
         # Add highlight to current
-        category = self.categories[index]
-        checkbox = self.checkboxes.get(category.name)
-        if checkbox:
-            checkbox.add_class("highlighted")
-            # Scroll to make it visible with faster animation
-            checkbox.scroll_visible(animate=False)
+        checkbox = self._checkbox_by_index[index]
+        checkbox.add_class("highlighted")
+        # Scroll to make it visible with faster animation
+        checkbox.scroll_visible(animate=False)
+
+        self._prev_highlighted_index = index
 
     def _toggle_current_checkbox(self) -> None:
         """Toggle the currently highlighted checkbox."""
@@ -367,10 +421,8 @@ class ConfigScreen(Screen):
             return
 
         index = self._current_category_index
-        if index < 0 or index >= len(self.categories):
+        if index < 0 or index >= len(self._checkbox_by_index):
             return
 
-        category = self.categories[index]
-        checkbox = self.checkboxes.get(category.name)
-        if checkbox:
-            checkbox.value = not checkbox.value
+        checkbox = self._checkbox_by_index[index]
+        checkbox.value = not checkbox.value
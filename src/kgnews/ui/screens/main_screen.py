@@ -1,12 +1,17 @@
 """Main screen for displaying categorized news."""
 
+import asyncio
+import itertools
 import logging
+import time
+from functools import partial
 
 from textual import events
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical
 from textual.screen import Screen
-from textual.widgets import Footer, Label, Static
+from textual.timer import Timer
+from textual.widgets import ContentSwitcher, Footer, Label, Static
 
 from kgnews.api import APIClient, APIError
 from kgnews.cache import CacheManager
@@ -16,6 +21,13 @@ from kgnews.ui.widgets import CategoryTabs, StoryList
 
 logger = logging.getLogger(__name__)
 
+# Delay before showing a newly selected tab, so rapid tab switching only
+# renders the tab it settles on
+_TAB_SWITCH_DELAY = 0.05
+
+# Seconds after a successful load during which a plain refresh is skipped
+_REFRESH_TTL = 60.0
+
 
 class MainScreen(Screen):
     """Main application screen showing categorized news.
@@ -26,55 +38,84 @@ class MainScreen(Screen):
     BINDINGS = [
         ("c", "show_config", "Configure"),
         ("r", "refresh", "Refresh"),
+        ("R", "refresh(True)", "Force refresh"),
         ("q", "quit", "Quit"),
     ]
 
-    def __init__(self, *args, **kwargs):
-        """Initialize the MainScreen."""
+    CSS = """
+    #story-lists {
+        height: 1fr;
+    }
+    """
+
+    def __init__(self, *args, api_client: APIClient | None = None, **kwargs):
+        """Initialize the MainScreen.
+
+        Args:
+            api_client: Shared API client (defaults to the app's client)
+        """
         super().__init__(*args, **kwargs)
-        self.api_client = APIClient()
-        self.config_manager = ConfigManager()
+        self.api_client: APIClient = api_client or self.app.api_client
+        self.config_manager: ConfigManager = self.app.config_manager
         self.cache_manager = CacheManager()
         self.categories: list[Category] = []
+        self._category_by_name: dict[str, Category] = {}
         self.stories_by_category: dict[str, list[Story]] = {}
         self.current_batch_id: str | None = None
+        self._last_refresh_ts: float = 0.0  # time.monotonic() of the last load
         self._category_tabs: CategoryTabs | None = None
+        # The visible story list: a category's list, or the placeholder list
+        # used for empty and error states
         self._story_list: StoryList | None = None
+        self._placeholder_list: StoryList | None = None
+        self._story_switcher: ContentSwitcher | None = None
+        # Story lists already built per category name, reused on tab switches
+        self._story_lists: dict[str, StoryList] = {}
+        self._story_list_ids = itertools.count()
+        self._tab_switch_timer: Timer | None = None
+        self._fetching: set[str] = set()  # Category names with a fetch in flight
+        self._failed_fetches: set[str] = set()  # Category names whose fetch failed
         self._loading_label: Label | None = None
+        self._status: str = "Loading..."  # Text currently shown in the loading label
 
     def compose(self) -> ComposeResult:
         """Compose the main screen layout."""
         with Vertical():
             # Loading label (will be hidden after loading)
-            self._loading_label = Label("Loading...", id="loading")
+            self._loading_label = Label(self._status, id="loading")
             yield self._loading_label
 
             # Category tabs (will be populated in on_mount)
             self._category_tabs = CategoryTabs(id="category-tabs")
             yield self._category_tabs
 
-            # Story list
-            self._story_list = StoryList(id="story-list")
-            yield self._story_list
+            # Story lists, one per category, switched with the active tab
+            self._placeholder_list = StoryList(id="story-list")
+            self._story_list = self._placeholder_list
+            self._story_switcher = ContentSwitcher(
+                self._placeholder_list, id="story-lists", initial="story-list"
+            )
+            yield self._story_switcher
 
             # Footer with keyboard shortcuts
             yield Footer()
 
-    async def _load_stories(self) -> None:
+    async def _load_stories(self, batch_info: dict | None = None) -> None:
         """Load or refresh stories for all configured categories.
 
         Uses caching strategy: checks cache first, fetches from API if needed.
+
+        Args:
+            batch_info: Latest batch information if already fetched by the caller
         """
         if not self.categories:
             return
 
-        import asyncio
-
         # Step 1: Get latest batch information
-        self._loading_label.update("Checking for latest news batch...")
-        self._loading_label.display = True
+        if batch_info is None:
+            self._set_status("Checking for latest news batch...")
+            batch_info = await self.api_client.get_latest_batch()
 
-        batch_info = await self.api_client.get_latest_batch()
         self.current_batch_id = batch_info.get("id")
 
         if not self.current_batch_id:
@@ -83,15 +124,21 @@ class MainScreen(Screen):
             return
 
         # Step 2 & 3: Load cached stories and check against current batch
-        self._loading_label.update("Loading cached stories...")
+        self._set_status("Loading cached stories...")
         categories_to_fetch = []
 
-        for category in self.categories:
-            # Use stable category.name for caching (not UUID id which changes per batch)
-            cached_stories = self.cache_manager.get_cached_stories(
-                category.name, self.current_batch_id
+        # Read all cache entries concurrently in worker threads
+        # Use stable category.name for caching (not UUID id which changes per batch)
+        cached_results = await asyncio.gather(
+            *(
+                self.cache_manager.aget_cached_stories(
+                    category.name, self.current_batch_id
+                )
+                for category in self.categories
             )
+        )
 
+        for category, cached_stories in zip(self.categories, cached_results):
             if cached_stories is not None:
                 # Step 3: Use cached stories if they match current batch
                 # Store by name (stable) not id (changes per batch)
@@ -102,84 +149,158 @@ class MainScreen(Screen):
                 categories_to_fetch.append(category)
 
         # Fetch stories for categories without cache
+        cache_writes: list[tuple[str, str, list[Story]]] = []
         if categories_to_fetch:
-            self._loading_label.update(
+            self._set_status(
                 f"Fetching stories for {len(categories_to_fetch)} categories..."
             )
+            cache_writes = await self._fetch_categories(categories_to_fetch)
 
-            async def fetch_category_stories(
-                category: Category,
-            ) -> tuple[str, list[Story], str]:
-                """Fetch stories for a single category."""
-                try:
-                    # API requires UUID id, but we return stable name for dict key
-                    stories, batch_id = await self.api_client.get_stories(category.id)
-                    return (category.name, stories, batch_id)
-                except APIError as e:
-                    logger.error(f"Failed to fetch stories for {category.name}: {e}")
-                    return (category.name, [], "")
-
-            # Fetch all stories concurrently
-            results = await asyncio.gather(
-                *[fetch_category_stories(cat) for cat in categories_to_fetch]
-            )
+        # Write the cache and clean up old batches in the background,
+        # so stories are shown without waiting on disk I/O
+        self.run_worker(
+            partial(self._persist_cache, cache_writes, self.current_batch_id),
+            name="persist-cache",
+            group="cache",
+            thread=True,
+        )
 
-            # Store results and save to cache
-            for category_name, stories, batch_id in results:
-                if stories:
-                    # Use stable category name as key
-                    self.stories_by_category[category_name] = stories
-                    # Step 4: Save fetched stories to cache (using stable name)
-                    self.cache_manager.save_stories(category_name, batch_id, stories)
-
-        # Clean up old cache files from previous batches
-        self.cache_manager.clear_old_caches(self.current_batch_id)
+        # Only a load without failed fetches counts as up to date, so a
+        # refresh can retry the failed categories straight away
+        self._last_refresh_ts = 0.0 if self._failed_fetches else time.monotonic()
 
         # Hide loading label
-        self._loading_label.display = False
+        self._hide_status()
 
-    async def on_mount(self) -> None:
-        """Load data when screen is mounted."""
+    async def _fetch_categories(
+        self, categories: list[Category]
+    ) -> list[tuple[str, str, list[Story]]]:
+        """Fetch stories for categories from the API, handling each as it lands.
+
+        Stories are stored as they arrive, and the active tab's stories are
+        shown immediately, so fast categories render first.
+
+        Args:
+            categories: Categories to fetch stories for
+
+        Returns:
+            Cache writes as (category name, batch ID, stories) tuples
+        """
+        cache_writes: list[tuple[str, str, list[Story]]] = []
+
+        # Mark pending categories until their stories arrive
+        for category in categories:
+            self._fetching.add(category.name)
+            self._category_tabs.set_loading(category, True)
+
+        # Fetch all stories concurrently (multiplexed over HTTP/2 when available)
+        # API requires UUID id, but results are stored by stable name
+        categories_by_id = {cat.id: cat for cat in categories}
         try:
-            # Load configuration
-            config = self.config_manager.load()
-            selected_category_ids = config.selected_categories
+            async for category_id, result in self.api_client.iter_stories_for_categories(
+                list(categories_by_id)
+            ):
+                category = categories_by_id[category_id]
+                self._fetching.discard(category.name)
+                self._category_tabs.set_loading(category, False)
+
+                if isinstance(result, APIError):
+                    logger.error(
+                        f"Failed to fetch stories for {category.name}: {result}"
+                    )
+                    self._failed_fetches.add(category.name)
+                    continue
 
-            # Check if any categories are configured
-            if not selected_category_ids:
-                self._show_empty_state(
-                    "No categories configured. Press 'c' to configure."
-                )
-                return
+                self._failed_fetches.discard(category.name)
 
-            # Fetch all available categories from API
-            self._loading_label.update("Fetching categories...")
-            all_categories = await self.api_client.get_categories()
+                stories, batch_id = result
+                # Use stable category name as key; empty results are stored
+                # too, so the category isn't fetched again
+                self.stories_by_category[category.name] = stories
+                if stories:
+                    # Step 4: Queue fetched stories for caching (using stable name)
+                    cache_writes.append((category.name, batch_id, stories))
 
-            # Filter to only selected categories (match by stable name, not UUID id)
-            self.categories = [
-                cat for cat in all_categories if cat.name in selected_category_ids
-            ]
+                # Show the active tab's stories as soon as they arrive
+                if category.name == self._category_tabs.active_category:
+                    self._show_category(category.name)
+        finally:
+            for category in categories:
+                self._fetching.discard(category.name)
 
-            if not self.categories:
-                logger.warning(f"No matching categories found for selected IDs")
-                self._show_empty_state(
-                    "Selected categories not found. Press 'c' to reconfigure."
-                )
-                return
+        return cache_writes
 
-            # Create tabs for each category
-            for category in self.categories:
-                self._category_tabs.add_tab(category)
+    def _prefetch_neighbors(self) -> None:
+        """Prepare the tabs either side of the active one ahead of a switch.
 
-            # Load stories using the reusable method
-            await self._load_stories()
+        Neighbors with loaded stories get their story list built now, and
+        neighbors not fetched yet are fetched in a background worker. Failed
+        fetches are not retried here; a refresh retries them.
+        """
+        if not self._category_tabs:
+            return
 
-            # Show stories for the first category
-            if self.categories:
-                first_category = self.categories[0]
-                first_stories = self.stories_by_category.get(first_category.name, [])
-                self._story_list.set_stories(first_stories)
+        missing: list[Category] = []
+        for name in self._category_tabs.neighbor_categories():
+            category = self._category_by_name.get(name)
+            if (
+                category is None
+                or name in self._fetching
+                or name in self._failed_fetches
+            ):
+                continue
+            if name in self.stories_by_category:
+                self._get_story_list(name)
+            else:
+                missing.append(category)
+
+        if missing:
+            # Claim the categories now so later calls don't fetch them again
+            self._fetching.update(category.name for category in missing)
+            self.run_worker(self._prefetch(missing), name="prefetch", group="prefetch")
+
+    async def _prefetch(self, categories: list[Category]) -> None:
+        """Fetch and cache stories for categories in the background.
+
+        Args:
+            categories: Categories without loaded stories
+        """
+        cache_writes = await self._fetch_categories(categories)
+
+        for category in categories:
+            if category.name in self.stories_by_category:
+                self._get_story_list(category.name)
+
+        if cache_writes and self.current_batch_id:
+            self.run_worker(
+                partial(self._persist_cache, cache_writes, self.current_batch_id),
+                name="persist-cache",
+                group="cache",
+                thread=True,
+            )
+
+    def _persist_cache(
+        self, cache_writes: list[tuple[str, str, list[Story]]], batch_id: str
+    ) -> None:
+        """Save fetched stories and remove caches from previous batches.
+
+        Runs in a worker thread.
+
+        Args:
+            cache_writes: Tuples of (category name, batch ID, stories) to save
+            batch_id: Current batch ID whose cache files are kept
+        """
+        for category_name, story_batch_id, stories in cache_writes:
+            self.cache_manager.save_stories(category_name, story_batch_id, stories)
+
+        self.cache_manager.clear_old_caches(batch_id)
+
+    async def on_mount(self) -> None:
+        """Load data when screen is mounted."""
+        try:
+            # Load configuration
+            config = await self.config_manager.aload()
+            await self._bootstrap_screen(set(config.selected_categories))
 
         except APIError as e:
             logger.error(f"API error during screen load: {e}")
@@ -188,23 +309,183 @@ class MainScreen(Screen):
             logger.error(f"Unexpected error during screen load: {e}")
             self._show_error(f"An error occurred: {e}")
 
+    async def _bootstrap_screen(self, selected_ids: set[str]) -> None:
+        """Show the selected categories' tabs and stories.
+
+        Categories already shown keep their tabs, stories, and story lists;
+        only deselected ones are removed and newly selected ones added, so
+        this serves both the first load and reloads after a config change.
+
+        Args:
+            selected_ids: Names of the categories selected in the config
+
+        Raises:
+            APIError: If fetching categories or stories fails
+        """
+        # Check if any categories are configured
+        if not selected_ids:
+            await self._remove_categories(self.categories)
+            self.categories = []
+            self._category_by_name = {}
+            self._show_empty_state("No categories configured. Press 'c' to configure.")
+            return
+
+        # Fetch available categories and the latest batch concurrently
+        self._set_status("Fetching categories...")
+        all_categories, batch_info = await asyncio.gather(
+            self.api_client.get_categories(),
+            self.api_client.get_latest_batch(),
+        )
+
+        # Filter to only selected categories (match by stable name, not UUID id)
+        new_categories = [cat for cat in all_categories if cat.name in selected_ids]
+        new_names = {cat.name for cat in new_categories}
+        kept_names = new_names & self._category_by_name.keys()
+        previous_active = self._category_tabs.active_category
+
+        # Remove only the deselected categories; kept ones retain their
+        # tabs, stories, and story lists
+        await self._remove_categories(
+            [cat for cat in self.categories if cat.name not in new_names]
+        )
+
+        # Category objects are replaced since their UUIDs change per batch
+        self.categories = new_categories
+        self._category_by_name = {cat.name: cat for cat in self.categories}
+
+        if not self.categories:
+            logger.warning(f"No matching categories found for selected IDs")
+            self._show_empty_state(
+                "Selected categories not found. Press 'c' to reconfigure."
+            )
+            return
+
+        # Add tabs for newly selected categories, keeping the API's order
+        next_category: Category | None = None
+        for category in reversed(self.categories):
+            if category.name not in kept_names:
+                await self._category_tabs.add_tab(category, before=next_category)
+            next_category = category
+
+        # Stay on the active tab if it was kept, otherwise switch to the first
+        if previous_active not in kept_names:
+            self._category_tabs.activate(self.categories[0])
+            previous_active = self.categories[0].name
+
+        # Load stories, reusing the kept categories' cached stories
+        await self._load_stories(batch_info=batch_info)
+
+        self._show_category(previous_active)
+
     def on_category_tabs_category_changed(
         self, message: CategoryTabs.CategoryChanged
     ) -> None:
         """Handle category tab changes to update story list.
 
+        The update is debounced so only the tab the user settles on is shown.
+
         Args:
             message: CategoryChanged message from CategoryTabs
         """
-        category_id = message.category_id
+        if self._tab_switch_timer is not None:
+            self._tab_switch_timer.stop()
+        self._tab_switch_timer = self.set_timer(
+            _TAB_SWITCH_DELAY, partial(self._apply_tab_change, message.category_id)
+        )
+
+    def _apply_tab_change(self, category_id: str) -> None:
+        """Show the stories of the tab selected last.
+
+        Args:
+            category_id: Stable name of the newly active category
+        """
+        self._tab_switch_timer = None
+
+        # Update story list if the category is still configured
+        if category_id in self._category_by_name:
+            self._show_category(category_id)
+
+    def _show_category(self, category_name: str) -> None:
+        """Show a category's stories, reusing its story list when already built.
+
+        Each category keeps its own StoryList, so switching back to a tab only
+        swaps the visible list instead of rebuilding every item. A list is
+        rebuilt only when the category's stories have been replaced.
+
+        Args:
+            category_name: Stable name of the category to show
+        """
+        if not self._story_switcher:
+            return
+
+        self._switch_story_list(self._get_story_list(category_name))
 
-        # Find matching category and update story list
-        for category in self.categories:
-            if category.name == category_id:
-                stories = self.stories_by_category.get(category.name, [])
-                if self._story_list:
-                    self._story_list.set_stories(stories)
-                break
+        # Get the neighboring tabs ready once this one has been drawn
+        self.call_after_refresh(self._prefetch_neighbors)
+
+    def _get_story_list(self, category_name: str) -> StoryList:
+        """Get a category's story list, building or updating it as needed.
+
+        New lists are mounted hidden; use _switch_story_list to show one.
+
+        Args:
+            category_name: Stable name of the category
+
+        Returns:
+            The category's StoryList, showing its current stories
+        """
+        stories = self.stories_by_category.get(category_name, [])
+        story_list = self._story_lists.get(category_name)
+
+        if story_list is None:
+            story_list = StoryList(id=f"story-list-{next(self._story_list_ids)}")
+            story_list.display = False
+            self._story_lists[category_name] = story_list
+            self._story_switcher.mount(story_list)
+            story_list.set_stories(stories)
+        elif story_list.stories is not stories:
+            story_list.set_stories(stories)
+
+        return story_list
+
+    def _switch_story_list(self, story_list: StoryList) -> None:
+        """Make a story list the visible one, carrying focus over to it.
+
+        Args:
+            story_list: Story list to show
+        """
+        if story_list is self._story_list:
+            return
+
+        had_focus = self._story_list is not None and self._story_list.has_focus
+        self._story_switcher.current = story_list.id
+        self._story_list = story_list
+        if had_focus:
+            story_list.focus()
+
+    def _show_placeholder(self) -> None:
+        """Show the empty placeholder list instead of any category's stories."""
+        if self._placeholder_list is not None and self._story_switcher:
+            self._placeholder_list.set_stories([])
+            self._switch_story_list(self._placeholder_list)
+
+    async def _remove_categories(self, categories: list[Category]) -> None:
+        """Remove categories' tabs, stories, and story lists.
+
+        Args:
+            categories: Categories that are no longer selected
+        """
+        for category in categories:
+            self.stories_by_category.pop(category.name, None)
+            self._failed_fetches.discard(category.name)
+            story_list = self._story_lists.pop(category.name, None)
+            if story_list is not None:
+                if story_list is self._story_list:
+                    self._show_placeholder()
+                story_list.remove()
+
+            if self._category_tabs:
+                await self._category_tabs.remove_tab(category)
 
     def on_key(self, event: events.Key) -> None:
         """Handle key events to manage focus and navigation.
@@ -232,21 +513,33 @@ class MainScreen(Screen):
                 self._story_list.focus()
                 # Don't prevent default - let the ListView handle the navigation
 
-    def _show_empty_state(self, message: str) -> None:
-        """Show an empty state message.
+    def _set_status(self, message: str) -> None:
+        """Show a message in the loading label, updating it only on change.
 
         Args:
-            message: Message to display
+            message: Status text to display
         """
+        if not self._loading_label:
+            return
+
+        if message != self._status:
+            self._loading_label.update(message)
+            self._status = message
+        self._loading_label.display = True
+
+    def _hide_status(self) -> None:
+        """Hide the loading label."""
         if self._loading_label:
             self._loading_label.display = False
 
-        if self._story_list:
-            self._story_list.set_stories([])
+    def _show_empty_state(self, message: str) -> None:
+        """Show an empty state message.
 
-        if self._loading_label:
-            self._loading_label.update(message)
-            self._loading_label.display = True
+        Args:
+            message: Message to display
+        """
+        self._show_placeholder()
+        self._set_status(message)
 
     def _show_error(self, message: str) -> None:
         """Show an error message.
@@ -254,32 +547,28 @@ class MainScreen(Screen):
         Args:
             message: Error message to display
         """
-        if self._loading_label:
-            self._loading_label.update(f"Error: {message}")
-            self._loading_label.display = True
-
-        if self._story_list:
-            self._story_list.set_stories([])
+        self._set_status(f"Error: {message}")
+        self._show_placeholder()
 
-    async def action_refresh(self) -> None:
+    async def action_refresh(self, force: bool = False) -> None:
         """Refresh stories for all categories.
 
         Checks for latest batch and uses caching strategy to load stories.
+        Skipped if stories were loaded within the last minute, unless forced.
+
+        Args:
+            force: Refresh even if stories were loaded recently
         """
+        if not force and time.monotonic() - self._last_refresh_ts < _REFRESH_TTL:
+            self.notify("Already up to date")
+            return
+
         try:
             await self._load_stories()
 
             # Update the display with the currently active tab's stories
-            if self._category_tabs and self._category_tabs.active:
-                active_tab_id = self._category_tabs.active
-                active_category_id = (
-                    active_tab_id.replace("tab-", "", 1)
-                    if active_tab_id.startswith("tab-")
-                    else active_tab_id
-                )
-                stories = self.stories_by_category.get(active_category_id, [])
-                if self._story_list:
-                    self._story_list.set_stories(stories)
+            if self._category_tabs and self._category_tabs.active_category:
+                self._show_category(self._category_tabs.active_category)
 
         except APIError as e:
             logger.error(f"API error during refresh: {e}")
@@ -300,73 +589,30 @@ class MainScreen(Screen):
         # Push config screen and wait for result
         result = await self.app.push_screen_wait(ConfigScreen())
 
-        # If config was saved (result is True), reload this screen
-        if result:
-            logger.info("Configuration saved, reloading main screen")
-
-            # Reload configuration
-            config = self.config_manager.load()
-            selected_category_ids = config.selected_categories
+        # Only a saved config (result is True) can change what to show
+        if not result:
+            return
 
-            # Clear current state
-            self.categories = []
-            self.stories_by_category = {}
+        # Reload configuration
+        config = await self.config_manager.aload()
+        selected_category_ids = set(config.selected_categories)
 
-            # Clear all tabs
-            if self._category_tabs:
-                # Remove all existing tabs by clearing the internal state
-                self._category_tabs._tab_ids = []
-                self._category_tabs._tab_to_category = {}
-                # Clear the TabbedContent panes
-                self._category_tabs.clear_panes()
-
-            # Reload categories and stories
-            try:
-                # Check if any categories are configured
-                if not selected_category_ids:
-                    self._show_empty_state(
-                        "No categories configured. Press 'c' to configure."
-                    )
-                    return
-
-                # Fetch all available categories from API
-                self._loading_label.update("Fetching categories...")
-                self._loading_label.display = True
-                all_categories = await self.api_client.get_categories()
-
-                # Filter to only selected categories
-                self.categories = [
-                    cat for cat in all_categories if cat.name in selected_category_ids
-                ]
-
-                if not self.categories:
-                    logger.warning(f"No matching categories found for selected IDs")
-                    self._show_empty_state(
-                        "Selected categories not found. Press 'c' to reconfigure."
-                    )
-                    return
+        # Keep tabs and stories as they are if the selection did not change
+        if self.categories and selected_category_ids == self._category_by_name.keys():
+            logger.info("Category selection unchanged, keeping loaded stories")
+            return
 
-                # Create tabs for each category
-                for category in self.categories:
-                    self._category_tabs.add_tab(category)
+        logger.info("Configuration saved, reloading main screen")
 
-                # Load stories
-                await self._load_stories()
+        try:
+            await self._bootstrap_screen(selected_category_ids)
 
-                # Show stories for the first category
-                if self.categories:
-                    first_category = self.categories[0]
-                    first_stories = self.stories_by_category.get(
-                        first_category.name, []
-                    )
-                    self._story_list.set_stories(first_stories)
-
-            except APIError as e:
-                logger.error(f"API error during reload: {e}")
-                self._show_error(f"Failed to reload news: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error during reload: {e}")
-                self._show_error(f"An error occurred: {e}")
+        except APIError as e:
+            logger.error(f"API error during reload: {e}")
+            self._show_error(f"Failed to reload news: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error during reload: {e}")
+            self._show_error(f"An error occurred: {e}")
 
     def action_quit(self) -> None:
         """Quit the application."""
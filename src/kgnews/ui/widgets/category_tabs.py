@@ -1,7 +1,9 @@
 """CategoryTabs widget for navigating between news categories."""
 
 from textual.app import ComposeResult
+from textual.await_complete import AwaitComplete
 from textual.binding import Binding
+from textual.css.query import NoMatches
 from textual.message import Message
 from textual.widgets import TabbedContent, TabPane, Label
 from textual.widget import Widget
@@ -39,26 +41,68 @@ class CategoryTabs(TabbedContent):
         """Initialize the CategoryTabs widget."""
         super().__init__(*args, **kwargs)
         self._tab_ids: list[str] = []
+        self._tab_index: dict[str, int] = {}  # Maps tab_id to its position in _tab_ids
         self._tab_to_category: dict[
             str, str
         ] = {}  # Maps sanitized tab_id to original category name
 
-    def add_tab(self, category: Category) -> None:
-        """Add a new category tab.
+    @staticmethod
+    def _tab_id_for(category: Category) -> str:
+        """Build the tab ID for a category.
 
         Args:
-            category: Category to create tab for
+            category: Category to build the tab ID for
+
+        Returns:
+            Tab ID derived from the category's stable name
         """
         # Use stable category name as tab ID (prefix with 'tab-' for valid Textual ID)
-        # Sanitize name to remove invalid ID characters like |, (), spaces
-        safe_name = (
-            category.name.replace("|", "_")
-            .replace("(", "_")
-            .replace(")", "_")
-            .replace(" ", "_")
+        # safe_id is the name with invalid ID characters like |, (), spaces replaced
+        return f"tab-{category.safe_id}"
+
+    @property
+    def active_category(self) -> str | None:
+        """Name of the category whose tab is active, if any."""
+        return self._tab_to_category.get(self.active)
+
+    def neighbor_categories(self) -> list[str]:
+        """Get the categories on either side of the active tab, with wraparound.
+
+        Returns:
+            Names of the next and previous categories (without duplicates)
+        """
+        count = len(self._tab_ids)
+        index = self._tab_index.get(self.active)
+        if index is None or count < 2:
+            return []
+
+        neighbor_ids = dict.fromkeys(
+            (self._tab_ids[(index + 1) % count], self._tab_ids[(index - 1) % count])
         )
-        tab_id = f"tab-{safe_name}"
-        self._tab_ids.append(tab_id)
+        return [self._tab_to_category[tab_id] for tab_id in neighbor_ids]
+
+    def add_tab(
+        self, category: Category, before: Category | None = None
+    ) -> AwaitComplete:
+        """Add a new category tab.
+
+        Args:
+            category: Category to create tab for
+            before: Existing category to insert the tab before (defaults to the end)
+
+        Returns:
+            An optionally awaitable object that waits for the tab to be added
+        """
+        tab_id = self._tab_id_for(category)
+        before_id = self._tab_id_for(before) if before is not None else None
+
+        if before_id in self._tab_index:
+            self._tab_ids.insert(self._tab_index[before_id], tab_id)
+            self._reindex()
+        else:
+            before_id = None
+            self._tab_index[tab_id] = len(self._tab_ids)
+            self._tab_ids.append(tab_id)
         self._tab_to_category[tab_id] = category.name  # Store mapping to original name
 
         # Create a TabPane with just the category's display name
@@ -66,10 +110,53 @@ class CategoryTabs(TabbedContent):
         tab_pane = TabPane(category.display_name, id=tab_id)
 
         # Add the tab
-        self.add_pane(tab_pane)
+        await_add = self.add_pane(tab_pane, before=before_id)
 
         # Mount an empty label as placeholder to avoid showing TabPane ID
         tab_pane.mount(Label(""))
+        return await_add
+
+    def activate(self, category: Category) -> None:
+        """Make a category's tab the active one.
+
+        Args:
+            category: Category whose tab to activate
+        """
+        self.active = self._tab_id_for(category)
+
+    def remove_tab(self, category: Category) -> AwaitComplete:
+        """Remove a category's tab.
+
+        Args:
+            category: Category whose tab to remove
+
+        Returns:
+            An optionally awaitable object that waits for the tab to be removed
+        """
+        tab_id = self._tab_id_for(category)
+        if tab_id in self._tab_index:
+            del self._tab_ids[self._tab_index[tab_id]]
+            self._reindex()
+        self._tab_to_category.pop(tab_id, None)
+        return self.remove_pane(tab_id)
+
+    def _reindex(self) -> None:
+        """Rebuild the tab position map after tabs were inserted or removed."""
+        self._tab_index = {tab_id: index for index, tab_id in enumerate(self._tab_ids)}
+
+    def set_loading(self, category: Category, loading: bool) -> None:
+        """Show or clear a loading marker on a category's tab label.
+
+        Args:
+            category: Category whose tab to update
+            loading: Whether the category's stories are still loading
+        """
+        try:
+            tab = self.get_tab(self._tab_id_for(category))
+        except NoMatches:
+            return
+
+        tab.label = f"{category.display_name} …" if loading else category.display_name
 
     def action_next_tab(self) -> None:
         """Navigate to the next tab with wraparound."""
@@ -79,11 +166,8 @@ class CategoryTabs(TabbedContent):
         # Get current tab index
         current_id = self.active
 
-        try:
-            current_index = self._tab_ids.index(current_id)
-        except ValueError:
-            # If current tab not found, go to first
-            current_index = -1
+        # If current tab not found, go to first
+        current_index = self._tab_index.get(current_id, -1)
 
         # Calculate next index with wraparound
         next_index = (current_index + 1) % len(self._tab_ids)
@@ -104,11 +188,8 @@ class CategoryTabs(TabbedContent):
         # Get current tab index
         current_id = self.active
 
-        try:
-            current_index = self._tab_ids.index(current_id)
-        except ValueError:
-            # If current tab not found, go to last
-            current_index = 0
+        # If current tab not found, go to last
+        current_index = self._tab_index.get(current_id, 0)
 
         # Calculate previous index with wraparound
         prev_index = (current_index - 1) % len(self._tab_ids)
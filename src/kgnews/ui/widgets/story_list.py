@@ -24,6 +24,11 @@ class StoryList(ListView):
         self._stories: list[Story] = []
         self._expanded_stories: set[str] = set()  # Track expanded story IDs
 
+    @property
+    def stories(self) -> list[Story]:
+        """Stories currently displayed, as passed to set_stories."""
+        return self._stories
+
     def set_stories(self, stories: list[Story]) -> None:
         """Update the displayed stories.
 
@@ -31,7 +36,8 @@ class StoryList(ListView):
             stories: List of Story objects to display
         """
         self._stories = stories
-        self._expanded_stories.clear()  # Reset expansion state
+        # Keep stories expanded across updates, dropping those no longer listed
+        self._expanded_stories &= {story.id for story in stories}
 
         # Clear existing items
         self.clear()
@@ -42,17 +48,33 @@ class StoryList(ListView):
             self.append(empty_item)
             return
 
-        # Add each story as a list item
-        for i, story in enumerate(stories):
-            list_item = self._create_story_item(story, i)
-            self.append(list_item)
+        # Add all stories in one mount, formatted against a single "now"
+        self.extend(self._create_story_items(stories))
+
+    def _create_story_items(self, stories: list[Story]) -> list[ListItem]:
+        """Create ListItems for a list of stories.
+
+        Args:
+            stories: Stories to create items for
+
+        Returns:
+            ListItem widgets in the same order as stories
+        """
+        displays = Story.format_batch(stories)
+        return [
+            self._create_story_item(story, i, display)
+            for i, (story, display) in enumerate(zip(stories, displays))
+        ]
 
-    def _create_story_item(self, story: Story, index: int) -> ListItem:
+    def _create_story_item(
+        self, story: Story, index: int, display: str | None = None
+    ) -> ListItem:
         """Create a ListItem for a story.
 
         Args:
             story: Story to create item for
             index: Index in the story list
+            display: Preformatted collapsed text (from Story.format_batch)
 
         Returns:
             ListItem widget
@@ -64,7 +86,7 @@ class StoryList(ListView):
             content = self._create_expanded_content(story)
         else:
             # Show collapsed view (single line) - use Static for text wrapping
-            content = Static(story.format_display())
+            content = Static(display or story.format_display())
             content.styles.width = "100%"
 
         # Don't set ID to avoid conflicts when switching tabs
@@ -82,30 +104,12 @@ class StoryList(ListView):
         Returns:
             Static widget with formatted story details and text wrapping
         """
-        # Build multi-line content using Rich markup
-        time_str = story._format_time(story.published_at)
-
-        lines = [
-            f"[bold]{story.title}[/bold]",
-            f"[dim]Source: {story.source} | {time_str}[/dim]",
-            f"[dim]URL: {story.url}[/dim]",
-        ]
-
-        # Add excerpt/summary if available
-        if story.excerpt:
-            lines.append("")  # Blank line
-            lines.append(f"[italic]{story.excerpt}[/italic]")
-
-        lines.append("")  # Blank line
-        lines.append("[dim]Press Enter to collapse[/dim]")
-
-        # Join all lines into a single Static widget with wrapping enabled
-        content_text = "\n".join(lines)
-        widget = Static(content_text)
+        # Multi-line Rich markup, memoized on the story per elapsed minute
+        widget = Static(story.format_expanded())
         widget.styles.width = "100%"
         return widget
 
-    def action_toggle_story(self) -> None:
+    async def action_toggle_story(self) -> None:
         """Toggle expansion of the currently selected story."""
         if not self._stories:
             return
@@ -124,9 +128,9 @@ class StoryList(ListView):
             self._expanded_stories.add(story.id)
 
         # Refresh the display
-        self._refresh_story_item(selected_index)
+        await self._refresh_story_item(selected_index)
 
-    def _refresh_story_item(self, index: int) -> None:
+    async def _refresh_story_item(self, index: int) -> None:
         """Refresh a single story item to show its current state.
 
         Args:
@@ -135,17 +139,26 @@ class StoryList(ListView):
         if index >= len(self._stories):
             return
 
-        # Rebuild the entire list to refresh the selected item
-        # This is simpler and more reliable than trying to update individual items
-        current_index = self.index
-        self.clear()
+        items = list(self.query_children(ListItem))
+        if len(items) != len(self._stories):
+            # Items out of step with the stories; rebuild the whole list
+            current_index = self.index
+            self.clear()
+            self.extend(self._create_story_items(self._stories))
+
+            # Restore selection - call_after_refresh ensures highlight is preserved
+            self.call_after_refresh(self._restore_index, current_index)
+            return
 
-        for i, story in enumerate(self._stories):
-            list_item = self._create_story_item(story, i)
-            self.append(list_item)
+        # Swap in a freshly built item right after the old one, then drop the
+        # old one, so the highlighted position never points at another story
+        old_item = items[index]
+        new_item = self._create_story_item(self._stories[index], index)
+        await self.mount(new_item, after=old_item)
+        await old_item.remove()
 
-        # Restore selection - call_after_refresh ensures highlight is preserved
-        self.call_after_refresh(self._restore_index, current_index)
+        if self.index == index:
+            new_item.highlighted = True
 
     def _restore_index(self, index: int) -> None:
         """Restore the selection index after refresh.
@@ -0,0 +1,5 @@
+"""Shared utilities."""
+
+from kgnews.utils import json
+
+__all__ = ["json"]